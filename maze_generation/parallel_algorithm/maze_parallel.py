@@ -0,0 +1,218 @@
+'''Maze Generation with Parallel Region Carving and Stitching'''
+
+# Import configs, classes, and libraries
+from utils.config import W, n_rows, n_cols, white
+from utils.cell import Cell
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import pygame
+import random
+import time
+import pickle
+
+# Moves as (row offset, col offset, wall of current cell, wall of next cell),
+# matching the wall layout used by delete_walls in the other generators
+MOVES = [(-1, 0, 3, 1), (1, 0, 1, 3), (0, -1, 0, 2), (0, 1, 2, 0)]
+
+def region_seed(seed, index):
+    '''Return the RNG seed for region index, independent of scheduling'''
+    return f"{seed}:{index}"
+
+def carve_region(shm_name, cols, row0, row1, col0, col1, seed):
+    '''Carve a perfect maze inside one region of the shared wall array
+
+    Runs a randomized depth first search restricted to rows [row0, row1)
+    and cols [col0, col1). Only walls between cells of this region are
+    touched, so regions can be carved concurrently without locking.
+    '''
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    walls = shm.buf
+    rng = random.Random(seed)
+
+    visited = set([(row0, col0)])
+    stack = [(row0, col0)]
+    while stack:
+        row, col = stack[-1]
+
+        # Collect unvisited neighbours inside the region
+        neighbours = []
+        for dr, dc, wall, next_wall in MOVES:
+            r, c = row + dr, col + dc
+            if row0 <= r < row1 and col0 <= c < col1 and (r, c) not in visited:
+                neighbours.append((r, c, wall, next_wall))
+
+        # Backtrack
+        if not neighbours:
+            stack.pop()
+            continue
+
+        # Move forward
+        r, c, wall, next_wall = rng.choice(neighbours)
+        walls[(row * cols + col) * 4 + wall] = 0
+        walls[(r * cols + c) * 4 + next_wall] = 0
+        visited.add((r, c))
+        stack.append((r, c))
+
+    del walls
+    shm.close()
+
+# Parallel Maze Generation Class
+class MazeParallel:
+    def __init__(self, seed=0, workers=4, rows=n_rows, cols=n_cols, render=False):
+        '''Initialize region layout
+
+        The region layout depends on workers, so the maze is reproducible
+        for a given (seed, workers) pair; workers is fixed by default rather
+        than taken from the machine's CPU count.
+        '''
+
+        # Data structures setup
+        self.seed = seed
+        self.render = render
+        self.workers = workers
+        self.rows = rows
+        self.cols = cols
+        self.walls = None  # 4 bytes per cell, 1 where a wall stands
+        self.region_rows, self.region_cols = self.split(self.workers)
+
+    def split(self, workers):
+        '''Return (row bands, col bands) giving about one region per worker
+
+        Uses the largest region count up to workers that factors into bands
+        fitting the grid, picking the factor pair with the squarest regions.
+        '''
+
+        for count in range(min(workers, self.rows * self.cols), 0, -1):
+            pairs = [(d, count // d) for d in range(1, count + 1)
+                     if count % d == 0 and d <= self.rows and count // d <= self.cols]
+            if pairs:
+                return min(pairs, key=lambda p: max(self.rows / p[0], self.cols / p[1])
+                           / min(self.rows / p[0], self.cols / p[1]))
+        return 1, 1
+
+    @staticmethod
+    def bounds(size, parts):
+        '''Return the start offsets of parts near-equal bands over size'''
+        return [size * k // parts for k in range(parts + 1)]
+
+    def regions(self):
+        '''Return (row0, row1, col0, col1) for every region in a fixed order'''
+
+        row_bounds = self.bounds(self.rows, self.region_rows)
+        col_bounds = self.bounds(self.cols, self.region_cols)
+        return [(row_bounds[i], row_bounds[i + 1], col_bounds[j], col_bounds[j + 1])
+                for i in range(self.region_rows)
+                for j in range(self.region_cols)]
+
+    def stitch(self, walls, regions):
+        '''Carve one passage per edge of a random spanning tree of regions'''
+
+        rng = random.Random(region_seed(self.seed, "stitch"))
+
+        # Randomized DFS over the region grid
+        visited = set([(0, 0)])
+        stack = [(0, 0)]
+        while stack:
+            i, j = stack[-1]
+            neighbours = [(i + di, j + dj) for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+                          if 0 <= i + di < self.region_rows
+                          and 0 <= j + dj < self.region_cols
+                          and (i + di, j + dj) not in visited]
+            if not neighbours:
+                stack.pop()
+                continue
+
+            ni, nj = rng.choice(neighbours)
+            row0, row1, col0, col1 = regions[i * self.region_cols + j]
+            nrow0, nrow1, ncol0, ncol1 = regions[ni * self.region_cols + nj]
+
+            # Pick a random cell pair across the shared border
+            if ni != i:
+                col = rng.randrange(col0, col1)
+                row, r = (row0 - 1, row0) if ni < i else (row1 - 1, row1)
+                cells = [(row, col), (r, col)]
+            else:
+                row = rng.randrange(row0, row1)
+                col, c = (col0 - 1, col0) if nj < j else (col1 - 1, col1)
+                cells = [(row, col), (row, c)]
+            self.delete_wall(walls, *cells)
+
+            visited.add((ni, nj))
+            stack.append((ni, nj))
+
+    def delete_wall(self, walls, current, following):
+        '''Remove the wall between two neighbouring cells in the wall array'''
+
+        (row, col), (r, c) = current, following
+        for dr, dc, wall, next_wall in MOVES:
+            if (row + dr, col + dc) == (r, c):
+                walls[(row * self.cols + col) * 4 + wall] = 0
+                walls[(r * self.cols + c) * 4 + next_wall] = 0
+
+    def return_cell(self, row, col):
+        '''Return a new Cell built from the wall array, or None if out of bounds'''
+
+        if row < 0 or col < 0 or row > self.rows - 1 or col > self.cols - 1:
+            return None
+
+        base = (row * self.cols + col) * 4
+        return Cell(row, col, [bool(wall) for wall in self.walls[base:base + 4]],
+                    inMaze=True)
+
+    def cells(self):
+        '''Return the full grid of Cell objects (expensive for huge mazes)'''
+        return [[self.return_cell(i, j) for j in range(self.cols)]
+                for i in range(self.rows)]
+
+    def save_image(self, path="maze_parallel.png"):
+        '''Draw the maze on an off-screen Pygame surface and save it'''
+
+        screen = pygame.Surface((self.rows * W, self.cols * W))
+        screen.fill(white)
+        for i in range(self.rows):
+            for j in range(self.cols):
+                self.return_cell(i, j).draw(screen)
+        pygame.image.save(screen, path)
+
+    def run(self):
+        '''Carve regions in parallel, stitch them, and save the maze'''
+
+        regions = self.regions()
+        shm = shared_memory.SharedMemory(create=True, size=self.rows * self.cols * 4)
+        try:
+            walls = shm.buf
+            walls[:] = b"\x01" * len(walls)
+
+            # Carve every region in the process pool
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(carve_region, shm.name, self.cols,
+                                       *region, region_seed(self.seed, index))
+                           for index, region in enumerate(regions)]
+                for future in futures:
+                    future.result()
+
+            # Join regions into a single perfect maze
+            self.stitch(walls, regions)
+
+            # Keep a compact copy, Cell objects are built on demand
+            self.walls = bytes(walls)
+            del walls
+        finally:
+            shm.close()
+            shm.unlink()
+
+        # Final save (rendering is opt-in, huge mazes do not fit a surface)
+        if self.render:
+            self.save_image()
+        with open("maze_parallel.dat", "wb") as f:
+            pickle.dump({"rows": self.rows, "cols": self.cols, "walls": self.walls}, f)
+
+# Run the algorithm
+if __name__ == "__main__":
+
+    start = time.time()
+    maze = MazeParallel()
+    maze.run()
+    end = time.time()
+    print(f"Total Time Elapsed: {(end - start)}")
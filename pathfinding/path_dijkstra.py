@@ -3,13 +3,16 @@
 # Import configs, classes, and libraries 
 from utils.config import W, maze_width, n_rows, n_cols, white, red, light_blue 
 from utils.cell import Cell
+from utils.maze_cache import maze_cache
 import networkx as nx
 import pygame
 import time
-import pickle
 
 # Dijkstra Pathfinder Class
 class DijkstraPathfinder:
+    # Bump when maze_to_graph changes so cached graphs are rebuilt
+    graph_version = 1
+
     def __init__(self):
         '''Initialize Pygame, load maze, and reset cell states'''
 
@@ -18,9 +21,8 @@ class DijkstraPathfinder:
         self.screen = pygame.display.set_mode((maze_width, maze_width))
         pygame.display.set_caption("Dijkstra Pathfinding")
 
-        # Load the .dat maze
-        with open("./maze_prims.dat", "rb") as f:
-            self.cells = pickle.load(f)
+        # Load the .dat maze (parsed once per file content)
+        self.maze_key, self.cells = maze_cache.load("./maze_prims.dat")
 
         # Reset cell states
         for i in range(n_rows):
@@ -87,7 +89,8 @@ class DijkstraPathfinder:
         '''Run Dijkstra pathfinding algorithm'''
 
         # Create graph and set start/end nodes
-        G = self.maze_to_graph()
+        G = maze_cache.index(self.maze_key, "graph", self.maze_to_graph,
+                             (n_rows, n_cols, self.graph_version))
         end = (n_rows - 1, n_cols - 1)
         start = (0, 0)
 
@@ -13,3 +13,7 @@ white = (255, 255, 255)
 red = (255, 0, 0)
 black = (0, 0, 0)
 light_blue = (173, 216, 230)
+
+# Maze cache
+cache_size = 8 # number of mazes kept in memory
+cache_dir = None # directory for on-disk index cache (None to disable)
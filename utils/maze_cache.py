@@ -0,0 +1,170 @@
+'''Process-wide LRU cache of loaded mazes and derived solver indexes'''
+
+# Import configs, classes, and libraries
+from utils.config import cache_size, cache_dir
+from utils.cell import Cell
+from collections import OrderedDict
+import hashlib
+import pickle
+import os
+
+# Maze Cache Class
+class MazeCache:
+    def __init__(self, max_size=cache_size, directory=cache_dir):
+        '''Initialize an empty cache holding at most max_size mazes'''
+
+        self.max_size = max_size
+        self.directory = directory
+        self.entries = OrderedDict()  # hash -> {"walls": ..., "indexes": {...}}
+
+    @staticmethod
+    def file_hash(data):
+        '''Return the SHA-256 hex digest of raw maze file bytes'''
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def to_walls(cells):
+        '''Return the immutable wall layout of a grid of cells'''
+        return tuple(tuple(tuple(cell.lines) for cell in row) for row in cells)
+
+    @staticmethod
+    def compact_to_walls(maze):
+        '''Return the wall layout of a compact {rows, cols, walls} maze'''
+
+        rows, cols, walls = maze["rows"], maze["cols"], maze["walls"]
+        flags = tuple(bool(wall) for wall in walls)
+        return tuple(tuple(flags[(i * cols + j) * 4:(i * cols + j) * 4 + 4]
+                           for j in range(cols))
+                     for i in range(rows))
+
+    @staticmethod
+    def to_cells(walls):
+        '''Build a fresh grid of Cell objects from a wall layout'''
+        return [[Cell(i, j, list(lines)) for j, lines in enumerate(row)]
+                for i, row in enumerate(walls)]
+
+    def get_entry(self, key):
+        '''Return cached entry for key and mark it most recently used'''
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put_entry(self, key, walls):
+        '''Store a wall layout under key, evicting least recently used mazes'''
+
+        entry = {"walls": walls, "indexes": {}}
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        return entry
+
+    def load(self, path):
+        '''Return (key, cells) for the maze file at path
+
+        The file is read and hashed on every call, so a rewritten maze is
+        never mistaken for a cached one, but only unpickled the first time
+        its content hash is seen. The walls are also kept in the cache
+        directory, if set, so other processes skip the unpickle too. Hits
+        rebuild fresh cells from the walls, since solvers mutate cell state
+        while drawing.
+        '''
+
+        # Read and hash the file
+        with open(path, "rb") as f:
+            data = f.read()
+        key = self.file_hash(data)
+
+        entry = self.get_entry(key)
+        if entry is None:
+            entry = self.put_entry(key, None)
+        if entry["walls"] is not None:
+            return key, self.to_cells(entry["walls"])
+
+        # Try the on-disk cache
+        walls_path = self.disk_path(key, "walls") if self.directory is not None else None
+        entry["walls"] = self.read_disk(walls_path)
+        if entry["walls"] is not None:
+            return key, self.to_cells(entry["walls"])
+
+        # Parse and store (Cell grid, or the compact format of MazeParallel)
+        maze = pickle.loads(data)
+        if isinstance(maze, dict):
+            entry["walls"] = self.compact_to_walls(maze)
+            cells = self.to_cells(entry["walls"])
+        else:
+            cells = maze
+            entry["walls"] = self.to_walls(cells)
+        self.write_disk(walls_path, entry["walls"])
+        return key, cells
+
+    def disk_path(self, key, name, params=()):
+        '''Return the on-disk cache file for name (walls or an index) of maze key'''
+
+        if params:
+            name = f"{name}." + "-".join(str(p) for p in params)
+        return os.path.join(self.directory, f"{key}.{name}.pkl")
+
+    def read_disk(self, path):
+        '''Return the unpickled cache file at path, or None if absent'''
+
+        if self.directory is None or not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def write_disk(self, path, value):
+        '''Atomically pickle value to path, creating the cache directory'''
+
+        if self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = path + f".{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def index(self, key, name, build, params=()):
+        '''Return derived index name for maze key, building it at most once
+
+        build is called with no arguments on a miss. params must list
+        everything else the index depends on (grid size, builder version)
+        so a changed config or builder never picks up a stale index. Results
+        are kept in memory alongside the maze and, if a cache directory is
+        set, pickled to disk so later processes can skip preprocessing too.
+        '''
+
+        entry = self.get_entry(key)
+        if entry is None:
+            entry = self.put_entry(key, None)
+        indexes = entry["indexes"]
+        index_key = (name, tuple(params))
+        if index_key in indexes:
+            return indexes[index_key]
+
+        # Try the on-disk cache
+        path = self.disk_path(key, name, params) if self.directory is not None else None
+        value = self.read_disk(path)
+        if value is not None:
+            indexes[index_key] = value
+            return value
+
+        # Build and store
+        value = build()
+        indexes[index_key] = value
+        self.write_disk(path, value)
+        return value
+
+    def clear(self):
+        '''Drop all in-memory entries'''
+
+        self.entries.clear()
+
+# Shared cache used by the pathfinders
+maze_cache = MazeCache()